@@ -0,0 +1,86 @@
+"""Startup-time benchmark for the web, bot and combined entry points.
+
+Usage: python bench_startup.py [runs]
+
+Reports the median module import time of each role and the time from
+launching `python web.py` until /health answers its first request.
+"""
+import os
+import sys
+import time
+import socket
+import statistics
+import subprocess
+import tempfile
+import urllib.request
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MODULES = ['web', 'bot', 'app']
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t)"
+)
+
+def free_port():
+    """Ask the OS for an unused TCP port"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def time_import(module, cwd):
+    """Import a module in a fresh interpreter and return the seconds it took"""
+    result = subprocess.run(
+        [sys.executable, '-c', IMPORT_SNIPPET.format(module=module)],
+        cwd=cwd, env=dict(os.environ, PYTHONPATH=ROOT, DATA_FILE='bot_data.json'),
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr.strip().splitlines() or [f'exit {result.returncode}'])[-1])
+    return float(result.stdout.strip())
+
+def time_first_request(cwd, timeout=30.0):
+    """Start web.py and return the seconds until /health responds"""
+    port = free_port()
+    url = f'http://127.0.0.1:{port}/health'
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'web.py')],
+        cwd=cwd, env=dict(os.environ, PORT=str(port), DATA_FILE='bot_data.json'),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError('web.py exited before serving a request')
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    response.read()
+                return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f'no response from {url} within {timeout}s')
+    finally:
+        proc.terminate()
+        proc.wait()
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    # Run from an empty directory so bot_data.json in the repo is untouched
+    with tempfile.TemporaryDirectory() as cwd:
+        for module in MODULES:
+            try:
+                samples = [time_import(module, cwd) for _ in range(runs)]
+                print(f"import {module:<4} median {statistics.median(samples) * 1000:8.1f} ms")
+            except RuntimeError as e:
+                print(f"import {module:<4} failed: {e}")
+
+        try:
+            samples = [time_first_request(cwd) for _ in range(runs)]
+            print(f"web.py first request median {statistics.median(samples) * 1000:8.1f} ms")
+        except RuntimeError as e:
+            print(f"web.py first request failed: {e}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,569 @@
+import os
+import logging
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, WebAppInfo
+from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
+import asyncio
+from datetime import datetime
+import threading
+import sys
+
+import state
+
+# Setup logging
+logging.basicConfig(
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', 
+    level=logging.INFO
+)
+logger = logging.getLogger(__name__)
+
+# Environment variables
+BOT_TOKEN = os.getenv('BOT_API')
+ADMIN_ID = int(os.getenv('ADMIN_ID', '0')) if os.getenv('ADMIN_ID') else None
+WEBAPP_URL = os.getenv('WEBAPP_URL', 'https://tgreward.shop/tiktokbot.php')
+
+# Global bot application
+bot_application = None
+
+def is_running():
+    """Whether the bot application has been created"""
+    return bot_application is not None
+
+def schedule_share_notification(user_id):
+    """Notify admin about a share from a non-async caller (the Flask thread)"""
+    if ADMIN_ID and bot_application:
+        # Use asyncio to run the coroutine in the background
+        loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=lambda: loop.run_until_complete(notify_admin_share(user_id)),
+            daemon=True
+        ).start()
+
+async def notify_admin_share(user_id):
+    """Notify admin about new share - Enhanced"""
+    if not ADMIN_ID or not bot_application:
+        return
+    
+    try:
+        user_info = state.user_data.get(user_id, {})
+        user_shares = user_info.get('shares', 0)
+        first_name = user_info.get('first_name', 'Unknown')
+        username = user_info.get('username', '')
+        
+        status = "🎉 VIP UNLOCKED!" if user_shares >= 3 else f"📊 Progress: {user_shares}/3"
+        
+        await bot_application.bot.send_message(
+            chat_id=ADMIN_ID,
+            text=f"🔥 Bagong Share!\n\n👤 User: {first_name}\n🆔 ID: {user_id}\n📱 Username: @{username if username else 'Walang username'}\n📊 Total Shares: {user_shares}\n{status}\n⏰ Oras: {datetime.now().strftime('%H:%M:%S')}\n📅 Today's Total: {len(state.today_shares)}"
+        )
+    except Exception as e:
+        logger.error(f"Error notifying admin: {e}")
+
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Start command handler - Enhanced"""
+    try:
+        user = update.effective_user
+        user_id = str(user.id)
+        
+        logger.info(f"Start command received from user {user_id}")
+        
+        # Reset daily stats if needed
+        state.reset_daily_stats_if_needed()
+        
+        # Track new user
+        if user_id not in state.user_data:
+            state.total_users += 1
+            state.user_data[user_id] = {
+                'shares': 0, 
+                'joined': True,
+                'first_name': user.first_name or 'Unknown',
+                'last_name': user.last_name or '',
+                'username': user.username or '',
+                'join_date': datetime.now().isoformat()
+            }
+            state.index_user(user_id)
+            state.save_data()  # Save data after new user
+            logger.info(f"New user registered: {user_id}")
+        
+        # Create webapp button
+        webapp_button = InlineKeyboardButton(
+            text="🔴 Manood ng LIVE TikTok VIP",
+            web_app=WebAppInfo(url=f"{WEBAPP_URL}")
+        )
+        
+        # Create VIP button - NEW
+        vip_button = InlineKeyboardButton(
+            text="💎 Kumuha ng VIP Access",
+            url="https://t.me/LapaganXMennuBot"
+        )
+        
+        # Create other buttons
+        keyboard = [
+            [webapp_button],
+            [vip_button],  # Added VIP button
+            [
+                InlineKeyboardButton("📱 Paano Mag-share?", callback_data="how_to_share"),
+                InlineKeyboardButton("💎 VIP Benefits", callback_data="vip_benefits")
+            ],
+            [
+                InlineKeyboardButton("👥 Join Group", url="https://t.me/+i7hIT6gq23s3ZmU1"),
+                InlineKeyboardButton("📊 Stats", callback_data="stats")
+            ]
+        ]
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        
+        welcome_message = f"""
+🎉 **Kumusta {user.first_name}!** 
+
+Maligayang pagdating sa **TikTok VIP Bot**! 🔥
+
+🌟 **Ano ang makakakuha mo:**
+• Access sa exclusive TikTok VIP content
+• Live streaming ng mga sikat na Pinay creators
+• Premium features at walang ads!
+
+📱 **Dalawang paraan para mag-VIP:**
+
+**Option 1: FREE (Share Method)**
+1. I-click ang "Manood ng LIVE" button
+2. Mag-share sa 3 Telegram groups
+3. Automatic VIP access!
+
+**Option 2: INSTANT VIP**
+• I-click ang "💎 Kumuha ng VIP Access"
+• Direct VIP access kaagad!
+
+✨ Mga benefits ng VIP membership:
+• Unlimited viewing
+• HD quality streams  
+• Exclusive content
+• Priority support
+
+👆 **Pumili ng method sa baba!**
+"""
+        
+        await update.message.reply_text(
+            welcome_message, 
+            reply_markup=reply_markup,
+            parse_mode='Markdown'
+        )
+        
+        logger.info(f"Welcome message sent to user {user_id}")
+        
+        # Notify admin about new user
+        if ADMIN_ID:
+            try:
+                stats = state.get_display_stats()
+                await context.bot.send_message(
+                    chat_id=ADMIN_ID,
+                    text=f"👋 Bagong User!\n\n👤 Pangalan: {user.first_name} {user.last_name or ''}\n🆔 User ID: {user_id}\n📱 Username: @{user.username or 'Walang username'}\n⏰ Sumali: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n📊 Updated Stats:\n👥 Verified Users: {stats['verified_users']:,}\n💎 VIP Users: {stats['vip_users']:,}\n🔥 Active Users: {stats['active_users']:,}"
+                )
+                logger.info(f"Admin notified about new user {user_id}")
+            except Exception as e:
+                logger.error(f"Error notifying admin about new user: {e}")
+                
+    except Exception as e:
+        logger.error(f"Error in start command: {e}")
+        try:
+            await update.message.reply_text("❌ May error sa bot. Subukan ulit mamaya.")
+        except:
+            pass
+
+async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle button callbacks - Enhanced"""
+    try:
+        query = update.callback_query
+        await query.answer()
+        
+        user_id = str(query.from_user.id)
+        data = query.data
+        
+        logger.info(f"Button callback: {data} from user {user_id}")
+        
+        # Reset daily stats if needed
+        state.reset_daily_stats_if_needed()
+        
+        if data == "how_to_share":
+            message = """
+📱 **Paano Mag-share sa Telegram Groups?**
+
+**Hakbang 1:** I-click ang "🔴 Manood ng LIVE" button sa taas
+**Hakbang 2:** Sa webapp, i-click ang "SHARE NOW" button
+**Hakbang 3:** Pipili ka ng 3 Telegram groups na sasalihan mo
+**Hakbang 4:** I-send ang link sa bawat group
+**Hakbang 5:** Babalik ka sa webapp at makikita mo ang progress
+**Hakbang 6:** Pagkatapos ng 3 shares, automatic VIP access na!
+
+💡 **Tips:**
+• Hanapin ang mga active Filipino Telegram groups
+• I-share sa mga groups na interested sa TikTok content
+• Huwag mag-spam sa iisang group
+
+🚀 **Alternative:** I-click ang "💎 Kumuha ng VIP Access" para sa instant VIP!
+
+🔥 Ready na? Pumili ng method sa main menu!
+"""
+            await query.edit_message_text(message, parse_mode='Markdown')
+        
+        elif data == "vip_benefits":
+            message = """
+💎 **TikTok VIP Benefits**
+
+🎯 **Exclusive Content:**
+• Premium Pinay TikTok videos
+• Live streaming events
+• Behind-the-scenes content
+
+📱 **App Features:**
+• HD quality playback
+• No advertisements
+• Offline download option
+• Priority customer support
+
+🌟 **Community Access:**
+• VIP-only Telegram group
+• Direct chat with creators
+• Early access to new content
+• Special contests and giveaways
+
+⭐ **Bonus Features:**
+• Daily new content updates
+• Request specific content
+• VIP badge sa profile
+• Monthly exclusive events
+
+🚀 **Dalawang paraan para makakuha:**
+• FREE: Mag-share sa 3 groups
+• INSTANT: I-click ang "💎 Kumuha ng VIP Access"
+"""
+            await query.edit_message_text(message, parse_mode='Markdown')
+        
+        elif data == "stats":
+            user_shares = state.user_data.get(user_id, {}).get('shares', 0)
+            stats = state.get_display_stats()
+            
+            # Recent sharers list (today's shares)
+            recent_sharers = []
+            for share in state.today_shares[-10:]:  # Last 10 shares from today
+                name = share.get('first_name', 'Unknown')
+                shares = share.get('total_shares', 0)
+                time_str = datetime.fromisoformat(share.get('timestamp', '')).strftime('%H:%M') if share.get('timestamp') else ''
+                recent_sharers.append(f"• {name} ({shares} shares) - {time_str}")
+            
+            recent_text = "\n".join(recent_sharers) if recent_sharers else "Walang shares pa ngayong araw"
+            
+            message = f"""
+📊 **Bot Statistics**
+
+👤 **Your Progress:**
+• Shares: {user_shares}/3
+• Status: {'✅ VIP Member' if user_shares >= 3 else '⏳ Pending'}
+
+🌐 **Global Stats:**
+• 🔐 Verified Users: {stats['verified_users']:,}
+• 💎 VIP Members: {stats['vip_users']:,}
+• 🔥 Active Users: {stats['active_users']:,}
+• 📅 Today's Shares: {stats['daily_shares']}
+
+📋 **Today's Recent Sharers:**
+{recent_text}
+
+{'🎉 Congratulations! VIP access unlocked!' if user_shares >= 3 else '💪 Mag-share pa para sa VIP access!'}
+"""
+            await query.edit_message_text(message, parse_mode='Markdown')
+        
+        elif data == "back_to_menu":
+            # Recreate the main menu
+            webapp_button = InlineKeyboardButton(
+                text="🔴 Manood ng LIVE TikTok VIP",
+                web_app=WebAppInfo(url=f"{WEBAPP_URL}")
+            )
+            
+            vip_button = InlineKeyboardButton(
+                text="💎 Kumuha ng VIP Access",
+                url="https://t.me/LapaganXMennuBot"
+            )
+            
+            keyboard = [
+                [webapp_button],
+                [vip_button],
+                [
+                    InlineKeyboardButton("📱 Paano Mag-share?", callback_data="how_to_share"),
+                    InlineKeyboardButton("💎 VIP Benefits", callback_data="vip_benefits")
+                ],
+                [
+                    InlineKeyboardButton("👥 Join Group", url="https://t.me/+i7hIT6gq23s3ZmU1"),
+                    InlineKeyboardButton("📊 Stats", callback_data="stats")
+                ]
+            ]
+            reply_markup = InlineKeyboardMarkup(keyboard)
+            
+            welcome_message = f"""
+🎉 **Kumusta {query.from_user.first_name}!** 
+
+Maligayang pagdating sa **TikTok VIP Bot**! 🔥
+
+🌟 **Ano ang makakakuha mo:**
+• Access sa exclusive TikTok VIP content
+• Live streaming ng mga sikat na Pinay creators
+• Premium features at walang ads!
+
+📱 **Dalawang paraan para mag-VIP:**
+
+**Option 1: FREE (Share Method)**
+1. I-click ang "Manood ng LIVE" button
+2. Mag-share sa 3 Telegram groups
+3. Automatic VIP access!
+
+**Option 2: INSTANT VIP**
+• I-click ang "💎 Kumuha ng VIP Access"
+• Direct VIP access kaagad!
+
+✨ Mga benefits ng VIP membership:
+• Unlimited viewing
+• HD quality streams  
+• Exclusive content
+• Priority support
+
+👆 **Pumili ng method sa baba!**
+"""
+            await query.edit_message_text(welcome_message, reply_markup=reply_markup, parse_mode='Markdown')
+            return
+        
+        # Add back to main menu button for other callbacks
+        back_button = InlineKeyboardButton("🔙 Balik sa Menu", callback_data="back_to_menu")
+        reply_markup = InlineKeyboardMarkup([[back_button]])
+        
+        try:
+            await query.edit_message_reply_markup(reply_markup=reply_markup)
+        except Exception as e:
+            logger.error(f"Error editing message markup: {e}")
+            
+    except Exception as e:
+        logger.error(f"Error in button callback: {e}")
+
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Help command"""
+    try:
+        help_text = """
+🆘 **TikTok VIP Bot - Tulong**
+
+**Mga Available Commands:**
+• /start - Simulan ang bot
+• /help - Ipakita ang tulong
+• /stats - Tingnan ang inyong progress
+
+**Paano Gamitin:**
+1. I-type ang /start
+2. Pumili ng method:
+   - FREE: I-click "Manood ng LIVE" at mag-share
+   - INSTANT: I-click "Kumuha ng VIP Access"
+3. Enjoy VIP access!
+
+**May Problema?**
+• Siguruhing connected kayo sa internet
+• I-refresh ang webapp kung hindi gumagana
+• I-restart ang bot gamit ang /start
+
+**Admin Contact:** @ldentifyAphrodite (kung may emergency)
+
+🔥 Happy watching sa TikTok VIP content!
+"""
+        await update.message.reply_text(help_text, parse_mode='Markdown')
+        logger.info(f"Help command sent to user {update.effective_user.id}")
+    except Exception as e:
+        logger.error(f"Error in help command: {e}")
+
+async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Stats command - Enhanced with fake numbers"""
+    try:
+        user_id = str(update.effective_user.id)
+        user_shares = state.user_data.get(user_id, {}).get('shares', 0)
+        
+        # Reset daily stats if needed
+        state.reset_daily_stats_if_needed()
+        stats = state.get_display_stats()
+        
+        # Recent sharers list (today's shares)
+        recent_sharers = []
+        for share in state.today_shares[-10:]:  # Last 10 shares from today
+            name = share.get('first_name', 'Unknown')
+            shares = share.get('total_shares', 0)
+            time_str = datetime.fromisoformat(share.get('timestamp', '')).strftime('%H:%M') if share.get('timestamp') else ''
+            recent_sharers.append(f"• {name} ({shares} shares) - {time_str}")
+        
+        recent_text = "\n".join(recent_sharers) if recent_sharers else "Walang shares pa ngayong araw"
+        
+        message = f"""
+📊 **Bot Statistics**
+
+👤 **Your Progress:**
+• Shares: {user_shares}/3
+• Status: {'✅ VIP Member' if user_shares >= 3 else '⏳ Pending'}
+
+🌐 **Global Stats:**
+• 🔐 Verified Users: {stats['verified_users']:,}
+• 💎 VIP Members: {stats['vip_users']:,}
+• 🔥 Active Users: {stats['active_users']:,}
+• 📅 Today's Shares: {stats['daily_shares']}
+
+📋 **Today's Recent Sharers:**
+{recent_text}
+
+{'🎉 Congratulations! VIP access unlocked!' if user_shares >= 3 else '💪 Mag-share pa para sa VIP access o kaya i-click ang VIP button!'}
+"""
+        await update.message.reply_text(message, parse_mode='Markdown')
+        logger.info(f"Stats command sent to user {user_id}")
+    except Exception as e:
+        logger.error(f"Error in stats command: {e}")
+
+# Admin lists stay under Telegram's 4096-character message limit:
+# at most ADMIN_LIST_MAX rows, with names cut to ADMIN_NAME_MAX characters
+ADMIN_LIST_MAX = 25
+ADMIN_NAME_MAX = 32
+
+def shorten(value, length=ADMIN_NAME_MAX):
+    """Cut user-supplied text to a fixed length for admin replies"""
+    value = str(value)
+    return value if len(value) <= length else value[:length - 1] + "…"
+
+def format_user_list(users):
+    """Format users for admin command replies"""
+    lines = []
+    for i, user in enumerate(users, 1):
+        username = f"@{shorten(user['username'])}" if user['username'] else 'Walang username'
+        joined = str(user['join_date'])[:10] if user['join_date'] else '?'
+        lines.append(f"{i}. {shorten(user['first_name'])} ({username})\n   🆔 {user['user_id']} | 📊 {user['shares']} shares | 📅 {joined}")
+    return "\n".join(lines)
+
+def parse_limit(args, default, maximum=ADMIN_LIST_MAX):
+    """Read an optional count argument, clamped to 1..maximum"""
+    try:
+        limit = int(args[0]) if args else default
+    except ValueError:
+        limit = default
+    return max(1, min(limit, maximum))
+
+async def search_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Search users by username or name prefix (admin only)"""
+    try:
+        if update.effective_user.id != ADMIN_ID:
+            await update.message.reply_text("❌ Para sa admin lang ang command na ito.")
+            return
+
+        if not context.args:
+            await update.message.reply_text("Gamit: /search <username o pangalan>")
+            return
+
+        state.ensure_loaded()
+        query = " ".join(context.args)
+        users = state.get_users(state.user_index.search(query, 20))
+
+        if users:
+            message = f"🔎 Resulta para sa \"{shorten(query)}\":\n\n{format_user_list(users)}"
+        else:
+            message = f"🔎 Walang user na tugma sa \"{shorten(query)}\""
+        await update.message.reply_text(message)
+        logger.info(f"Search command sent to admin: {query}")
+    except Exception as e:
+        logger.error(f"Error in search command: {e}")
+
+async def top_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Top users by share count (admin only)"""
+    try:
+        if update.effective_user.id != ADMIN_ID:
+            await update.message.reply_text("❌ Para sa admin lang ang command na ito.")
+            return
+
+        state.ensure_loaded()
+        users = state.get_users(state.user_index.top_sharers(parse_limit(context.args, 10)))
+
+        message = f"🏆 Top Sharers:\n\n{format_user_list(users)}" if users else "🏆 Wala pang users"
+        await update.message.reply_text(message)
+        logger.info("Top command sent to admin")
+    except Exception as e:
+        logger.error(f"Error in top command: {e}")
+
+async def newusers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Most recently joined users (admin only)"""
+    try:
+        if update.effective_user.id != ADMIN_ID:
+            await update.message.reply_text("❌ Para sa admin lang ang command na ito.")
+            return
+
+        state.ensure_loaded()
+        users = state.get_users(state.user_index.newest(parse_limit(context.args, 10)))
+
+        message = f"👋 Mga Bagong User:\n\n{format_user_list(users)}" if users else "👋 Wala pang users"
+        await update.message.reply_text(message)
+        logger.info("Newusers command sent to admin")
+    except Exception as e:
+        logger.error(f"Error in newusers command: {e}")
+
+async def main():
+    """Main function to run the bot"""
+    global bot_application
+    
+    if not BOT_TOKEN:
+        logger.error("BOT_API environment variable not set!")
+        return
+    
+    # Load saved data
+    state.ensure_loaded()
+    
+    try:
+        # Create application
+        bot_application = Application.builder().token(BOT_TOKEN).build()
+        
+        # Add handlers
+        bot_application.add_handler(CommandHandler("start", start))
+        bot_application.add_handler(CommandHandler("help", help_command))
+        bot_application.add_handler(CommandHandler("stats", stats_command))
+        bot_application.add_handler(CommandHandler("search", search_command))
+        bot_application.add_handler(CommandHandler("top", top_command))
+        bot_application.add_handler(CommandHandler("newusers", newusers_command))
+        bot_application.add_handler(CallbackQueryHandler(button_callback))
+        
+        logger.info("Starting Telegram bot...")
+        
+        # Initialize and start the bot
+        await bot_application.initialize()
+        await bot_application.start()
+        
+        # Start polling in the background
+        await bot_application.updater.start_polling(drop_pending_updates=True)
+        
+        logger.info("Bot is running successfully!")
+        
+        # Keep the bot running
+        while True:
+            await asyncio.sleep(1)
+            
+    except Exception as e:
+        logger.error(f"Error in bot main: {e}")
+    finally:
+        if bot_application:
+            try:
+                state.save_data()  # Save data before shutdown
+                await bot_application.stop()
+                await bot_application.shutdown()
+            except:
+                pass
+
+def run_bot_async():
+    """Run bot in async mode"""
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Bot stopped by user")
+        state.save_data()  # Save data on exit
+    except Exception as e:
+        logger.error(f"Bot error: {e}")
+        state.save_data()  # Save data on error
+
+if __name__ == '__main__':
+    # Bot-only mode: runs the Telegram bot without loading Flask
+    if not BOT_TOKEN:
+        logger.error("BOT_TOKEN is required!")
+        sys.exit(1)
+
+    run_bot_async()
@@ -0,0 +1,109 @@
+import threading
+from bisect import bisect_left, insort
+
+class UserIndex:
+    """Sorted secondary indexes over user_data for admin lookups.
+
+    Every index is a sorted list of (key, user_id) tuples, so lookups are a
+    binary search plus the rows returned, and updates touch one user only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names = []    # (lowercased username/name, user_id)
+        self._joined = []   # (join_date iso string, user_id)
+        self._shares = []   # (-shares, user_id), most shares first
+        # What each user is currently indexed under, so updates can remove it
+        self._indexed = {}
+
+    @staticmethod
+    def _name_keys(info):
+        keys = set()
+        for field in ('username', 'first_name', 'last_name'):
+            value = str(info.get(field) or '').strip().lower()
+            if value:
+                keys.add(value)
+        return keys
+
+    @staticmethod
+    def _remove(entries, entry):
+        i = bisect_left(entries, entry)
+        if i < len(entries) and entries[i] == entry:
+            del entries[i]
+
+    def rebuild(self, user_data):
+        """Index every user from scratch (after loading data from file)"""
+        with self._lock:
+            self._names = []
+            self._joined = []
+            self._shares = []
+            self._indexed = {}
+            for user_id, info in user_data.items():
+                names = self._name_keys(info)
+                joined = info.get('join_date', '')
+                shares = info.get('shares', 0)
+                self._names.extend((name, user_id) for name in names)
+                self._joined.append((joined, user_id))
+                self._shares.append((-shares, user_id))
+                self._indexed[user_id] = (names, joined, shares)
+            self._names.sort()
+            self._joined.sort()
+            self._shares.sort()
+
+    def update(self, user_id, info):
+        """Add a user or re-index one whose record changed"""
+        names = self._name_keys(info)
+        joined = info.get('join_date', '')
+        shares = info.get('shares', 0)
+
+        with self._lock:
+            old = self._indexed.get(user_id)
+            if old == (names, joined, shares):
+                return
+            if old:
+                old_names, old_joined, old_shares = old
+                for name in old_names - names:
+                    self._remove(self._names, (name, user_id))
+                if old_joined != joined:
+                    self._remove(self._joined, (old_joined, user_id))
+                if old_shares != shares:
+                    self._remove(self._shares, (-old_shares, user_id))
+            else:
+                old_names, old_joined, old_shares = set(), None, None
+
+            for name in names - old_names:
+                insort(self._names, (name, user_id))
+            if old_joined != joined:
+                insort(self._joined, (joined, user_id))
+            if old_shares != shares:
+                insort(self._shares, (-shares, user_id))
+            self._indexed[user_id] = (names, joined, shares)
+
+    def search(self, prefix, limit=20):
+        """User ids whose username or name starts with prefix"""
+        # Usernames are indexed without the @ that admins tend to type
+        prefix = prefix.strip().lstrip('@').lower()
+        results = []
+        if not prefix:
+            return results
+
+        with self._lock:
+            i = bisect_left(self._names, (prefix,))
+            while i < len(self._names) and len(results) < limit:
+                name, user_id = self._names[i]
+                if not name.startswith(prefix):
+                    break
+                if user_id not in results:
+                    results.append(user_id)
+                i += 1
+        return results
+
+    def top_sharers(self, limit=10):
+        """User ids with the most shares, highest first"""
+        with self._lock:
+            return [user_id for _, user_id in self._shares[:limit]]
+
+    def newest(self, limit=10):
+        """User ids ordered by join date, most recent first"""
+        with self._lock:
+            return [user_id for _, user_id in reversed(self._joined[-limit:])] if limit > 0 else []
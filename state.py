@@ -0,0 +1,141 @@
+import os
+import json
+import logging
+import threading
+from datetime import date
+
+from indexes import UserIndex
+
+logger = logging.getLogger(__name__)
+
+# Global variables for tracking - Enhanced with fake initial stats
+user_data = {}
+# Initial fake stats - these will increment as real users join
+INITIAL_VERIFIED_USERS = 1000
+INITIAL_VIP_USERS = 500
+INITIAL_ACTIVE_USERS = 800
+
+total_users = 0
+daily_shares = 0
+share_history = []  # Track share history
+today_shares = []   # Track today's shares specifically
+last_reset_date = None  # Track when we last reset daily stats
+
+# Secondary indexes over user_data for admin search and top-N queries
+user_index = UserIndex()
+
+# File to save data persistently
+DATA_FILE = os.getenv('DATA_FILE', 'bot_data.json')
+
+# Data is read from DATA_FILE on first use instead of at import time.
+# _loaded is only set once the file has been read, so no thread can save
+# (and overwrite the file with) state that is still being loaded.
+_loaded = False
+_load_lock = threading.Lock()
+
+def ensure_loaded():
+    """Load data from file the first time it is needed"""
+    global _loaded
+    if _loaded:
+        return
+    with _load_lock:
+        if _loaded:
+            return
+        load_data()
+
+        # Reset daily stats if it's a new day
+        _reset_daily_stats()
+        _loaded = True
+
+def load_data():
+    """Load data from file"""
+    global user_data, total_users, daily_shares, share_history, today_shares, last_reset_date
+
+    try:
+        if os.path.exists(DATA_FILE):
+            with open(DATA_FILE, 'r') as f:
+                data = json.load(f)
+                user_data = data.get('user_data', {})
+                total_users = data.get('total_users', 0)
+                daily_shares = data.get('daily_shares', 0)
+                share_history = data.get('share_history', [])
+                today_shares = data.get('today_shares', [])
+                last_reset_date = data.get('last_reset_date', None)
+                user_index.rebuild(user_data)
+
+                logger.info(f"Data loaded: {total_users} users, {daily_shares} shares")
+    except Exception as e:
+        logger.error(f"Error loading data: {e}")
+
+def reset_daily_stats_if_needed():
+    """Reset daily stats if it's a new day"""
+    ensure_loaded()
+    _reset_daily_stats()
+
+def _reset_daily_stats():
+    global daily_shares, today_shares, last_reset_date
+
+    current_date = date.today().isoformat()
+
+    if last_reset_date != current_date:
+        daily_shares = 0
+        today_shares = []
+        last_reset_date = current_date
+        _write_data()
+        logger.info(f"Daily stats reset for new day: {current_date}")
+
+def save_data():
+    """Save data to file"""
+    # Never overwrite the file with state that was not loaded from it
+    ensure_loaded()
+    _write_data()
+
+def _write_data():
+    try:
+        data = {
+            'user_data': user_data,
+            'total_users': total_users,
+            'daily_shares': daily_shares,
+            'share_history': share_history,
+            'today_shares': today_shares,
+            'last_reset_date': last_reset_date
+        }
+        with open(DATA_FILE, 'w') as f:
+            json.dump(data, f, indent=2)
+        logger.info("Data saved successfully")
+    except Exception as e:
+        logger.error(f"Error saving data: {e}")
+
+def index_user(user_id):
+    """Refresh the secondary indexes after a user record changes"""
+    user_index.update(user_id, user_data[user_id])
+
+def get_users(user_ids):
+    """Public fields of the given users, in the order given"""
+    users = []
+    for user_id in user_ids:
+        info = user_data.get(user_id, {})
+        users.append({
+            'user_id': user_id,
+            'first_name': info.get('first_name', 'Unknown'),
+            'username': info.get('username', ''),
+            'shares': info.get('shares', 0),
+            'join_date': info.get('join_date', '')
+        })
+    return users
+
+def get_display_stats():
+    """Get stats with fake initial numbers added"""
+    ensure_loaded()
+    real_users = len(user_data)
+    real_vip_users = len([u for u in user_data.values() if u.get('shares', 0) >= 3])
+
+    return {
+        'verified_users': INITIAL_VERIFIED_USERS + total_users,
+        'vip_users': INITIAL_VIP_USERS + real_vip_users,
+        'active_users': INITIAL_ACTIVE_USERS + real_users,
+        'total_users': total_users,
+        'daily_shares': daily_shares,
+        'real_users': real_users,
+        'real_vip_users': real_vip_users
+    }
@@ -0,0 +1,182 @@
+import os
+import hmac
+import logging
+from datetime import datetime, date
+from flask import Flask, render_template, request, jsonify
+
+import state
+
+# Setup logging
+logging.basicConfig(
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    level=logging.INFO
+)
+logger = logging.getLogger(__name__)
+
+# Flask app for webapp
+app = Flask(__name__)
+
+# Admin API endpoints are disabled unless this key is set
+ADMIN_API_KEY = os.getenv('ADMIN_API_KEY')
+
+# Called with the user id after every share; app.py points this at the bot
+# when both run in the same process so the web role never imports telegram
+share_notifier = None
+# Returns whether the bot application exists; also set by app.py
+bot_running = None
+
+@app.route('/')
+def webapp():
+    """Serve the main webapp"""
+    return render_template('index.html')
+
+@app.route('/api/share', methods=['POST'])
+def track_share():
+    """Track user shares - Enhanced with today's shares tracking"""
+    data = request.json
+    user_id = str(data.get('user_id'))  # Convert to string for consistency
+
+    # Reset daily stats if needed
+    state.reset_daily_stats_if_needed()
+
+    if user_id:
+        # Initialize user data if not exists
+        if user_id not in state.user_data:
+            state.user_data[user_id] = {
+                'shares': 0,
+                'joined': False,
+                'first_name': data.get('first_name', 'Unknown'),
+                'username': data.get('username', ''),
+                'join_date': datetime.now().isoformat()
+            }
+
+        # Increment shares
+        state.user_data[user_id]['shares'] += 1
+        state.daily_shares += 1
+
+        # Add to share history
+        share_entry = {
+            'user_id': user_id,
+            'first_name': state.user_data[user_id]['first_name'],
+            'username': state.user_data[user_id]['username'],
+            'timestamp': datetime.now().isoformat(),
+            'total_shares': state.user_data[user_id]['shares'],
+            'date': date.today().isoformat()
+        }
+        state.share_history.append(share_entry)
+        state.today_shares.append(share_entry)
+
+        # Keep only last 100 shares in history to avoid too much data
+        if len(state.share_history) > 100:
+            state.share_history = state.share_history[-100:]
+
+        # Update admin indexes once the record is complete, then save data
+        state.index_user(user_id)
+        state.save_data()
+
+        # Schedule notification to admin
+        if share_notifier:
+            try:
+                share_notifier(user_id)
+            except Exception as e:
+                logger.error(f"Failed to schedule admin notification: {e}")
+
+    current_shares = state.user_data.get(user_id, {}).get('shares', 0)
+    return jsonify({
+        'status': 'success',
+        'shares': current_shares,
+        'vip_status': current_shares >= 3
+    })
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Get current stats with fake numbers"""
+    state.reset_daily_stats_if_needed()
+    stats = state.get_display_stats()
+
+    return jsonify({
+        'verified_users': stats['verified_users'],
+        'vip_users': stats['vip_users'],
+        'active_users': stats['active_users'],
+        'daily_shares': stats['daily_shares'],
+        'total_users': stats['total_users']
+    })
+
+@app.route('/api/recent_shares', methods=['GET'])
+def get_recent_shares():
+    """Get recent shares for admin"""
+    state.reset_daily_stats_if_needed()
+    # Return last 20 shares
+    recent = state.share_history[-20:]
+    return jsonify({'shares': recent})
+
+@app.route('/api/today_shares', methods=['GET'])
+def get_today_shares():
+    """Get today's shares specifically"""
+    state.reset_daily_stats_if_needed()
+    return jsonify({
+        'shares': state.today_shares,
+        'count': len(state.today_shares),
+        'date': date.today().isoformat()
+    })
+
+def is_admin_request():
+    """Check the X-Admin-Key header against ADMIN_API_KEY"""
+    key = request.headers.get('X-Admin-Key', '')
+    return bool(ADMIN_API_KEY) and hmac.compare_digest(key.encode(), ADMIN_API_KEY.encode())
+
+def get_limit(default, maximum=100):
+    """Read the limit query parameter, clamped to 1..maximum"""
+    limit = request.args.get('limit', default, type=int)
+    return max(1, min(limit, maximum))
+
+@app.route('/api/admin/search', methods=['GET'])
+def admin_search_users():
+    """Find users by username or name prefix (admin only)"""
+    if not is_admin_request():
+        return jsonify({'status': 'error', 'message': 'Forbidden'}), 403
+
+    state.ensure_loaded()
+    query = request.args.get('q', '')
+    user_ids = state.user_index.search(query, get_limit(20))
+    return jsonify({'query': query, 'users': state.get_users(user_ids)})
+
+@app.route('/api/admin/top', methods=['GET'])
+def admin_top_users():
+    """Top users by share count, or newest users with by=joined (admin only)"""
+    if not is_admin_request():
+        return jsonify({'status': 'error', 'message': 'Forbidden'}), 403
+
+    state.ensure_loaded()
+    by = request.args.get('by', 'shares')
+    limit = get_limit(10)
+    if by == 'shares':
+        user_ids = state.user_index.top_sharers(limit)
+    elif by == 'joined':
+        user_ids = state.user_index.newest(limit)
+    else:
+        return jsonify({'status': 'error', 'message': "by must be 'shares' or 'joined'"}), 400
+    return jsonify({'by': by, 'users': state.get_users(user_ids)})
+
+@app.route('/health')
+def health_check():
+    state.reset_daily_stats_if_needed()
+    stats = state.get_display_stats()
+    return jsonify({
+        'status': 'healthy',
+        'bot_running': bool(bot_running and bot_running()),
+        'verified_users': stats['verified_users'],
+        'vip_users': stats['vip_users'],
+        'active_users': stats['active_users'],
+        'daily_shares': stats['daily_shares']
+    })
+
+def run_flask():
+    """Run Flask app"""
+    port = int(os.environ.get('PORT', 8080))
+    logger.info(f"Starting Flask app on port {port}")
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True, use_reloader=False)
+
+if __name__ == '__main__':
+    # Web-only mode: serves the webapp and API without loading the bot
+    run_flask()